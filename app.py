@@ -64,8 +64,8 @@ def main():
                 
                 # Step 3: Translation via Pipeline
                 st.info(f"🌍 Translating to {target_lang}...")
-                pipeline = TranslationPipeline()
-                translation_result = pipeline.translate(extracted_text, target_lang)
+                with TranslationPipeline() as pipeline:
+                    translation_result = pipeline.translate(extracted_text, target_lang)
                 
                 if not translation_result["success"]:
                     st.error(f"❌ Translation failed: {translation_result.get('error', 'Unknown error')}")
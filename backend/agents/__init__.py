@@ -1,5 +1,10 @@
 """Agent definitions for language detection and translation."""
-from .language_detector import create_language_detection_agent
-from .translator import create_translation_agent
+from .language_detector import create_language_detection_agent, LANGUAGE_DETECTION_INSTRUCTIONS
+from .translator import create_translation_agent, TRANSLATION_INSTRUCTIONS
 
-__all__ = ["create_language_detection_agent", "create_translation_agent"]
+__all__ = [
+    "create_language_detection_agent",
+    "create_translation_agent",
+    "LANGUAGE_DETECTION_INSTRUCTIONS",
+    "TRANSLATION_INSTRUCTIONS",
+]
@@ -5,6 +5,15 @@ Explicitly configured with Qubrid GPT-OSS-20B model.
 from agno.agent import Agent
 from backend.llm.agno_qubrid_model import QubridModel
 
+# Instructions for the language detection agent.
+# Shared with the direct pipeline backend so both send the same prompt.
+LANGUAGE_DETECTION_INSTRUCTIONS = [
+    "You are a language detection specialist.",
+    "Identify the language of the given text.",
+    "Return ONLY the language name (e.g., 'English', 'Spanish', 'French').",
+    "Do not provide explanations or additional information.",
+]
+
 
 def create_language_detection_agent() -> Agent:
     """
@@ -24,12 +33,7 @@ def create_language_detection_agent() -> Agent:
     return Agent(
         name="Language Detection Specialist",
         model=qubrid_model,
-        instructions=[
-            "You are a language detection specialist.",
-            "Identify the language of the given text.",
-            "Return ONLY the language name (e.g., 'English', 'Spanish', 'French').",
-            "Do not provide explanations or additional information.",
-        ],
+        instructions=LANGUAGE_DETECTION_INSTRUCTIONS,
         markdown=False,
         debug_mode=True,  # Enable Agno execution logs
         stream=True,  # Enable streaming for proper response handling
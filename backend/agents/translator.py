@@ -5,6 +5,16 @@ Explicitly configured with Qubrid GPT-OSS-20B model.
 from agno.agent import Agent
 from backend.llm.agno_qubrid_model import QubridModel
 
+# Instructions for the translation agent.
+# Shared with the direct pipeline backend so both send the same prompt.
+TRANSLATION_INSTRUCTIONS = [
+    "You are a professional translator.",
+    "Translate the given text to the specified target language.",
+    "Return ONLY the translated text.",
+    "Preserve the original meaning and tone.",
+    "Do not add explanations or notes.",
+]
+
 
 def create_translation_agent() -> Agent:
     """
@@ -24,13 +34,7 @@ def create_translation_agent() -> Agent:
     return Agent(
         name="Translation Specialist",
         model=qubrid_model,
-        instructions=[
-            "You are a professional translator.",
-            "Translate the given text to the specified target language.",
-            "Return ONLY the translated text.",
-            "Preserve the original meaning and tone.",
-            "Do not add explanations or notes.",
-        ],
+        instructions=TRANSLATION_INSTRUCTIONS,
         markdown=False,
         debug_mode=True,  # Enable Agno execution logs
         stream=True,  # Enable streaming for proper response handling
@@ -5,6 +5,7 @@ Wraps Qubrid API to work with Agno's agent framework.
 import os
 from typing import Optional, Dict, Any, List
 from agno.models.openai import OpenAIChat
+from backend.llm.qubrid_client import get_chat_base_url
 
 
 class QubridModel(OpenAIChat):
@@ -26,12 +27,13 @@ class QubridModel(OpenAIChat):
         Args:
             id: Model identifier
             api_key: Qubrid API key (defaults to QUBRID_API_KEY env var)
-            base_url: Qubrid base URL (defaults to QUBRID_CHAT_URL env var)
+            base_url: Qubrid base URL (defaults to QUBRID_CHAT_URL env var,
+                with any trailing /chat/completions removed)
             **kwargs: Additional OpenAIChat parameters
         """
         # Get credentials from environment if not provided
         api_key = api_key or os.getenv("QUBRID_API_KEY")
-        base_url = base_url or os.getenv("QUBRID_CHAT_URL", "https://platform.qubrid.com/api/v1/qubridai")
+        base_url = base_url or get_chat_base_url()
         
         # Ensure base_url doesn't have trailing slash
         if base_url.endswith("/"):
@@ -5,16 +5,46 @@ Pure function-based infrastructure layer - no CrewAI imports.
 import os
 import json
 import requests
-from typing import Dict, Iterator
+from typing import Dict, Iterator, Optional
 from dotenv import load_dotenv
 
 load_dotenv()
 
+DEFAULT_CHAT_URL = "https://platform.qubrid.com/api/v1/qubridai/chat/completions"
+CHAT_COMPLETIONS_PATH = "/chat/completions"
+
+
+def get_chat_url() -> str:
+    """
+    Resolve the full chat completions URL from QUBRID_CHAT_URL.
+    
+    QUBRID_CHAT_URL is documented as the full endpoint; a bare base URL is
+    also accepted and gets /chat/completions appended.
+    
+    Returns:
+        Chat completions endpoint URL
+    """
+    chat_url = os.getenv("QUBRID_CHAT_URL", DEFAULT_CHAT_URL).rstrip("/")
+    if not chat_url.endswith(CHAT_COMPLETIONS_PATH):
+        chat_url += CHAT_COMPLETIONS_PATH
+    return chat_url
+
+
+def get_chat_base_url() -> str:
+    """Resolve the OpenAI-style base URL (without /chat/completions)."""
+    return get_chat_url()[:-len(CHAT_COMPLETIONS_PATH)]
+
 
 def _parse_sse(response: requests.Response) -> Iterator[str]:
-    """Parse Server-Sent Events from streaming response."""
+    """
+    Parse Server-Sent Events from streaming response.
+    
+    Lines after [DONE] are still read (and ignored) so the body is fully
+    consumed and the connection can return to the session's pool.
+    """
+    done = False
     for line in response.iter_lines():
-        if not line:
+        if done or not line:
             continue
             
         decoded_line = line.decode("utf-8")
@@ -25,7 +55,8 @@ def _parse_sse(response: requests.Response) -> Iterator[str]:
         json_str = decoded_line[6:]  # Remove "data: " prefix
         
         if json_str.strip() == "[DONE]":
-            break
+            done = True
+            continue
         
         try:
             chunk = json.loads(json_str)
@@ -43,13 +74,26 @@ def _parse_sse(response: requests.Response) -> Iterator[str]:
             continue
 
 
-def _call_qubrid_api(prompt: str, temperature: float = 0.1) -> str:
+def _call_qubrid_api(
+    prompt: str,
+    temperature: Optional[float] = 0.1,
+    top_p: Optional[float] = 0.9,
+    max_tokens: Optional[int] = 1024,
+    system_prompt: Optional[str] = None,
+    system_role: str = "system",
+    session: Optional[requests.Session] = None,
+) -> str:
     """
     Internal function to call Qubrid GPT-OSS-20B API.
     
     Args:
         prompt: The prompt to send to the model
-        temperature: Sampling temperature
+        temperature: Sampling temperature (omitted from the request if None)
+        top_p: Nucleus sampling cutoff (omitted from the request if None)
+        max_tokens: Output token cap (omitted from the request if None)
+        system_prompt: Optional system message sent before the prompt
+        system_role: Role used for system_prompt (e.g. "developer")
+        session: Optional requests session for connection reuse across calls
         
     Returns:
         Complete response text
@@ -58,10 +102,7 @@ def _call_qubrid_api(prompt: str, temperature: float = 0.1) -> str:
         ValueError: If API request fails
     """
     api_key = os.getenv("QUBRID_API_KEY")
-    chat_url = os.getenv(
-        "QUBRID_CHAT_URL",
-        "https://platform.qubrid.com/api/v1/qubridai/chat/completions"
-    )
+    chat_url = get_chat_url()
     
     if not api_key:
         raise ValueError("QUBRID_API_KEY must be set in environment")
@@ -71,32 +112,39 @@ def _call_qubrid_api(prompt: str, temperature: float = 0.1) -> str:
         "Content-Type": "application/json",
     }
     
+    messages = []
+    if system_prompt:
+        messages.append({"role": system_role, "content": system_prompt})
+    messages.append({"role": "user", "content": prompt})
+    
     payload = {
         "model": "openai/gpt-oss-20b",
-        "messages": [{"role": "user", "content": prompt}],
-        "temperature": temperature,
-        "max_tokens": 1024,
-        "top_p": 0.9,
+        "messages": messages,
         "stream": True
     }
     
+    # Unset sampling parameters fall back to the server defaults
+    sampling = {"temperature": temperature, "max_tokens": max_tokens, "top_p": top_p}
+    payload.update({key: value for key, value in sampling.items() if value is not None})
+    
+    http = session or requests
+    
     try:
-        response = requests.post(
+        with http.post(
             chat_url,
             headers=headers,
             json=payload,
             timeout=60,
             stream=True
-        )
-        
-        if response.status_code != 200:
-            error_body = response.text
-            raise ValueError(f"Qubrid API Error {response.status_code}: {error_body}")
-        
-        # Collect streamed content
-        full_content = ""
-        for chunk in _parse_sse(response):
-            full_content += chunk
+        ) as response:
+            if response.status_code != 200:
+                error_body = response.text
+                raise ValueError(f"Qubrid API Error {response.status_code}: {error_body}")
+            
+            # Collect streamed content
+            full_content = ""
+            for chunk in _parse_sse(response):
+                full_content += chunk
         
         return full_content.strip()
         
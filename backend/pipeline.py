@@ -1,24 +1,70 @@
 """
-Translation pipeline orchestration using Agno agents.
-Agents execute via Agno's agent.run() with explicit Qubrid configuration.
+Translation pipeline orchestration.
+Model calls go through a pluggable backend: Agno agents (default) or the
+direct Qubrid streaming client, selected via TRANSLATION_BACKEND.
 """
-from typing import Dict, Any
-from backend.agents import create_language_detection_agent, create_translation_agent
+import os
+from abc import ABC, abstractmethod
+from typing import Dict, Any, List, Optional, Union
 
+import requests
 
-class TranslationPipeline:
+from backend.agents import (
+    create_language_detection_agent,
+    create_translation_agent,
+    LANGUAGE_DETECTION_INSTRUCTIONS,
+    TRANSLATION_INSTRUCTIONS,
+)
+from backend.llm.agno_qubrid_model import QubridModel
+from backend.llm.qubrid_client import _call_qubrid_api
+
+
+DEFAULT_BACKEND = "agno"
+
+
+def _detection_prompt(text: str) -> str:
+    """Build the language detection prompt shared by all backends."""
+    return f"Detect the language of this text: {text}"
+
+
+def _translation_prompt(text: str, target_language: str) -> str:
+    """Build the translation prompt shared by all backends."""
+    return f"Translate the following text to {target_language}:\n\n{text}"
+
+
+class PipelineBackend(ABC):
     """
-    Orchestrates the translation workflow using Agno agents.
+    Interface for the model calls made by TranslationPipeline.
     
-    Pipeline:
-    1. Language Detection Agent (Agno) → Qubrid GPT-OSS-20B
-    2. Translation Agent (Agno) → Qubrid GPT-OSS-20B
+    Implementations return the stripped response text and raise on failure;
+    TranslationPipeline turns exceptions into an error result.
+    """
+    
+    name: str = ""
+    
+    @abstractmethod
+    def detect_language(self, text: str) -> str:
+        """Return the detected source language of text."""
+    
+    @abstractmethod
+    def translate(self, text: str, target_language: str) -> str:
+        """Return text translated to target_language."""
+    
+    def close(self) -> None:
+        """Release resources held by the backend (no-op by default)."""
+
+
+class AgnoBackend(PipelineBackend):
+    """
+    Backend that executes Agno agents via agent.run().
     
-    Uses Agno framework for agent lifecycle and execution.
+    Provides Agno's agent lifecycle, session bookkeeping and debug logs.
     """
     
+    name = "agno"
+    
     def __init__(self):
-        """Initialize the translation pipeline with Agno agents."""
+        """Initialize the Agno detection and translation agents."""
         self.detection_agent = create_language_detection_agent()
         self.translation_agent = create_translation_agent()
     
@@ -50,9 +96,152 @@ class TranslationPipeline:
         
         return full_content.strip()
     
+    def detect_language(self, text: str) -> str:
+        """Detect the source language via the Agno detection agent."""
+        response = self.detection_agent.run(input=_detection_prompt(text))
+        return self._collect_streaming_response(response)
+    
+    def translate(self, text: str, target_language: str) -> str:
+        """Translate text via the Agno translation agent."""
+        response = self.translation_agent.run(
+            input=_translation_prompt(text, target_language)
+        )
+        return self._collect_streaming_response(response)
+
+
+class DirectBackend(PipelineBackend):
+    """
+    Backend that calls the Qubrid streaming client directly.
+    
+    Sends the same instructions, message roles, prompts and sampling
+    parameters as the Agno agents, without agent construction, run
+    bookkeeping or debug logging.
+    A single HTTP session is reused across calls, which suits batch jobs;
+    call close() (or use the pipeline as a context manager) when done.
+    """
+    
+    name = "direct"
+    # Agno's OpenAIChat sends agent instructions under this role ("developer"),
+    # which gpt-oss treats differently from "system"
+    system_role = QubridModel.default_role_map["system"]
+    # The Agno agents set no sampling parameters, so neither do we
+    sampling = {"temperature": None, "top_p": None, "max_tokens": None}
+    
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Initialize the direct backend.
+        
+        Args:
+            session: Optional requests session (a new one is created if omitted
+                and closed by close(); a provided session is left open)
+        """
+        self._owns_session = session is None
+        self.session = session or requests.Session()
+        self.detection_system_prompt = self._build_system_prompt(
+            LANGUAGE_DETECTION_INSTRUCTIONS
+        )
+        self.translation_system_prompt = self._build_system_prompt(
+            TRANSLATION_INSTRUCTIONS
+        )
+    
+    @staticmethod
+    def _build_system_prompt(instructions: List[str]) -> str:
+        """Render agent instructions as a bullet list, as Agno does."""
+        return "\n".join(f"- {instruction}" for instruction in instructions)
+    
+    def detect_language(self, text: str) -> str:
+        """Detect the source language with a single direct API call."""
+        return _call_qubrid_api(
+            _detection_prompt(text),
+            system_prompt=self.detection_system_prompt,
+            system_role=self.system_role,
+            session=self.session,
+            **self.sampling,
+        )
+    
+    def translate(self, text: str, target_language: str) -> str:
+        """Translate text with a single direct API call."""
+        return _call_qubrid_api(
+            _translation_prompt(text, target_language),
+            system_prompt=self.translation_system_prompt,
+            system_role=self.system_role,
+            session=self.session,
+            **self.sampling,
+        )
+    
+    def close(self) -> None:
+        """Close the HTTP session if this backend created it."""
+        if self._owns_session:
+            self.session.close()
+
+
+PIPELINE_BACKENDS = {
+    AgnoBackend.name: AgnoBackend,
+    DirectBackend.name: DirectBackend,
+}
+
+
+def create_pipeline_backend(name: Optional[str] = None) -> PipelineBackend:
+    """
+    Create a pipeline backend by name.
+    
+    Args:
+        name: Backend name ("agno" or "direct"). Defaults to the
+            TRANSLATION_BACKEND env var, then "agno".
+    
+    Returns:
+        Configured PipelineBackend
+    
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    name = (name or os.getenv("TRANSLATION_BACKEND") or DEFAULT_BACKEND).strip().lower()
+    
+    if name not in PIPELINE_BACKENDS:
+        available = ", ".join(sorted(PIPELINE_BACKENDS))
+        raise ValueError(f"Unknown translation backend '{name}' (available: {available})")
+    
+    return PIPELINE_BACKENDS[name]()
+
+
+class TranslationPipeline:
+    """
+    Orchestrates the translation workflow.
+    
+    Pipeline:
+    1. Language Detection → Qubrid GPT-OSS-20B
+    2. Translation → Qubrid GPT-OSS-20B
+    
+    Model calls are delegated to a PipelineBackend: Agno agents by default,
+    or the direct streaming client for lean, high-volume use. Use as a
+    context manager (or call close()) to release the backend's resources.
+    """
+    
+    def __init__(self, backend: Optional[Union[str, PipelineBackend]] = None):
+        """
+        Initialize the translation pipeline.
+        
+        Args:
+            backend: Backend instance or name; defaults to TRANSLATION_BACKEND
+        """
+        if isinstance(backend, PipelineBackend):
+            self.backend = backend
+        else:
+            self.backend = create_pipeline_backend(backend)
+    
+    def __enter__(self) -> "TranslationPipeline":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Release resources held by the backend."""
+        self.backend.close()
+    
     def translate(self, text: str, target_language: str) -> Dict[str, Any]:
         """
-        Execute the translation pipeline using Agno agents.
+        Execute the translation pipeline using the configured backend.
         
         Args:
             text: Text to translate
@@ -66,17 +255,11 @@ class TranslationPipeline:
                 - error: Error message if failed
         """
         try:
-            # Step 1: Language Detection via Agno Agent
-            detection_response = self.detection_agent.run(
-                input=f"Detect the language of this text: {text}"
-            )
-            detected_lang = self._collect_streaming_response(detection_response)
+            # Step 1: Language Detection
+            detected_lang = self.backend.detect_language(text)
             
-            # Step 2: Translation via Agno Agent
-            translation_response = self.translation_agent.run(
-                input=f"Translate the following text to {target_language}:\n\n{text}"
-            )
-            translated = self._collect_streaming_response(translation_response)
+            # Step 2: Translation
+            translated = self.backend.translate(text, target_language)
             
             return {
                 "success": True,
@@ -85,7 +268,7 @@ class TranslationPipeline:
                 "translated_text": translated,
                 "raw_output": translated
             }
-            
+        
         except Exception as e:
             return {
                 "success": False,
@@ -93,6 +276,3 @@ class TranslationPipeline:
                 "detected_language": None,
                 "translated_text": None
             }
-
-
-
@@ -0,0 +1,157 @@
+"""
+Benchmark per-call overhead and memory of the translation pipeline backends.
+
+By default both backends talk to a local HTTP/1.1 stub server that streams a
+canned completion with chunked transfer encoding, like the real endpoint, so
+the numbers reflect client-side overhead (agent run bookkeeping, logging,
+HTTP client and connection reuse, SSE parsing) rather than model latency.
+Pass --live to hit the real Qubrid endpoint configured in .env instead.
+
+Agno debug logs are discarded while a backend runs (they are still produced,
+so their cost is measured) and the results table is printed afterwards.
+
+Usage:
+    python -m benchmarks.benchmark_backends
+    python -m benchmarks.benchmark_backends --iterations 200 --backends direct
+    python -m benchmarks.benchmark_backends --live --iterations 5
+"""
+import argparse
+import contextlib
+import gc
+import os
+import statistics
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from tests.stub_server import StubServer, start_stub_server
+
+SAMPLE_TEXT = "Bonjour tout le monde. Ceci est un texte extrait d'une image."
+TARGET_LANGUAGE = "English"
+
+
+@contextlib.contextmanager
+def quiet_output() -> Iterator[None]:
+    """Discard stdout/stderr (Agno debug logs) for the duration of the block."""
+    with open(os.devnull, "w") as devnull:
+        with contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
+            yield
+
+
+def _measure_time(func: Callable[[], object], iterations: int) -> List[float]:
+    """Return per-call wall times in milliseconds."""
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def _measure_memory(func: Callable[[], object], iterations: int) -> Tuple[float, float]:
+    """Return (mean peak KiB per call, retained KiB after all calls)."""
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    peaks = []
+    for _ in range(iterations):
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        peaks.append((peak - before) / 1024)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.mean(peaks), (retained - baseline) / 1024
+
+
+def benchmark_backend(
+    name: str,
+    iterations: int,
+    warmup: int,
+    server: Optional[StubServer] = None,
+) -> Dict[str, float]:
+    """
+    Benchmark a single backend.
+
+    Args:
+        name: Backend name accepted by create_pipeline_backend
+        iterations: Number of measured pipeline calls
+        warmup: Number of unmeasured calls before timing
+        server: Stub server, used to count connections opened while timing
+
+    Returns:
+        Dict of timing (ms), memory (KiB) and connection statistics
+    """
+    from backend.pipeline import TranslationPipeline
+
+    start = time.perf_counter()
+    pipeline = TranslationPipeline(backend=name)
+    init_ms = (time.perf_counter() - start) * 1000
+
+    def call():
+        result = pipeline.translate(SAMPLE_TEXT, TARGET_LANGUAGE)
+        if not result["success"]:
+            raise RuntimeError(f"{name} backend failed: {result['error']}")
+        return result
+
+    try:
+        for _ in range(warmup):
+            call()
+
+        connections_before = server.connections if server else 0
+        timings = _measure_time(call, iterations)
+        connections = server.connections - connections_before if server else float("nan")
+        peak_kib, retained_kib = _measure_memory(call, max(1, min(iterations, 20)))
+    finally:
+        pipeline.close()
+
+    return {
+        "init_ms": init_ms,
+        "mean_ms": statistics.mean(timings),
+        "median_ms": statistics.median(timings),
+        "p95_ms": sorted(timings)[int(0.95 * (len(timings) - 1))],
+        "peak_kib": peak_kib,
+        "retained_kib": retained_kib,
+        "connections": connections,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--backends", nargs="+", default=["agno", "direct"])
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--live", action="store_true", help="Use the real Qubrid endpoint")
+    args = parser.parse_args()
+
+    server = None
+    if not args.live:
+        server = start_stub_server()
+        os.environ["QUBRID_CHAT_URL"] = server.chat_url
+        os.environ.setdefault("QUBRID_API_KEY", "benchmark")
+
+    try:
+        with quiet_output():
+            results = {
+                name: benchmark_backend(name, args.iterations, args.warmup, server)
+                for name in args.backends
+            }
+    finally:
+        if server:
+            server.shutdown()
+
+    # Each pipeline call makes two model requests (detection + translation);
+    # "conns" counts TCP connections opened during the timed calls (stub only)
+    print(f"{'backend':<8} {'init ms':>9} {'mean ms':>9} {'median ms':>10} "
+          f"{'p95 ms':>9} {'peak KiB':>9} {'retained KiB':>13} {'conns':>6}")
+    for name, stats in results.items():
+        print(f"{name:<8} {stats['init_ms']:>9.2f} {stats['mean_ms']:>9.2f} "
+              f"{stats['median_ms']:>10.2f} {stats['p95_ms']:>9.2f} "
+              f"{stats['peak_kib']:>9.1f} {stats['retained_kib']:>13.1f} "
+              f"{stats['connections']:>6}")
+
+
+if __name__ == "__main__":
+    main()
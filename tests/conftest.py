@@ -0,0 +1,15 @@
+"""Shared fixtures for the pipeline tests."""
+import pytest
+
+from tests.stub_server import start_stub_server
+
+
+@pytest.fixture
+def stub_server(monkeypatch):
+    """Start a recording stub server and point the Qubrid client at it."""
+    server = start_stub_server(payloads=[])
+    monkeypatch.setenv("QUBRID_CHAT_URL", server.chat_url)
+    monkeypatch.setenv("QUBRID_API_KEY", "test")
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,111 @@
+"""
+Local stub of the Qubrid chat completions endpoint.
+
+Streams a canned completion over HTTP/1.1 with chunked SSE, like the real
+endpoint. Used by the backend parity tests and the backend benchmark.
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+STUB_REPLY = "Hello everyone. This is text extracted from an image."
+STUB_PATH = "/v1/chat/completions"
+
+
+def _stub_sse_events(content: str) -> List[bytes]:
+    """Build an OpenAI-compatible chat completion SSE stream, one event per item."""
+    events = []
+    for index, word in enumerate(content.split(" ")):
+        delta = {"content": word if index == 0 else f" {word}"}
+        if index == 0:
+            delta["role"] = "assistant"
+        events.append({
+            "id": "chatcmpl-stub",
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": "openai/gpt-oss-20b",
+            "choices": [{"index": 0, "delta": delta, "finish_reason": None}],
+        })
+    events.append({
+        "id": "chatcmpl-stub",
+        "object": "chat.completion.chunk",
+        "created": 0,
+        "model": "openai/gpt-oss-20b",
+        "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+    })
+    lines = [f"data: {json.dumps(event)}\n\n" for event in events]
+    lines.append("data: [DONE]\n\n")
+    return [line.encode("utf-8") for line in lines]
+
+
+class StubServer(ThreadingHTTPServer):
+    """
+    Stub chat completions server.
+
+    Counts accepted connections and, if payloads is a list, records every
+    request body so callers can compare what each backend sent.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, payloads: Optional[List[dict]] = None):
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.connections = 0
+        self.payloads = payloads
+
+    @property
+    def chat_url(self) -> str:
+        """Full chat completions URL, the documented QUBRID_CHAT_URL form."""
+        return f"http://127.0.0.1:{self.server_port}{STUB_PATH}"
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Answer chat completion POSTs with a chunked, streamed completion."""
+
+    protocol_version = "HTTP/1.1"
+    # Like production servers, send each SSE chunk immediately (TCP_NODELAY)
+    disable_nagle_algorithm = True
+    events = _stub_sse_events(STUB_REPLY)
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        if self.path != STUB_PATH:
+            message = f"Unknown path {self.path}".encode("utf-8")
+            self.send_response(404)
+            self.send_header("Content-Length", str(len(message)))
+            self.end_headers()
+            self.wfile.write(message)
+            return
+
+        if self.server.payloads is not None:
+            self.server.payloads.append(json.loads(body))
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for event in self.events:
+            self.wfile.write(f"{len(event):x}\r\n".encode("ascii") + event + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(payloads: Optional[List[dict]] = None) -> StubServer:
+    """
+    Start the stub server in a background thread.
+
+    The environment is left untouched: callers point QUBRID_CHAT_URL at
+    server.chat_url themselves and call server.shutdown() when done.
+    """
+    server = StubServer(payloads)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
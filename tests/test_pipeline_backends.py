@@ -0,0 +1,90 @@
+"""
+Parity tests for the translation pipeline backends.
+
+Both backends run against the local stub server (see conftest.py), which
+records every request body and only serves the chat completions path.
+"""
+import pytest
+import requests
+
+from tests.stub_server import STUB_REPLY
+from backend.pipeline import DirectBackend, TranslationPipeline, create_pipeline_backend
+
+SAMPLE_TEXT = "Bonjour tout le monde. Ceci est un texte extrait d'une image."
+TARGET_LANGUAGE = "English"
+SAMPLING_KEYS = ("model", "temperature", "top_p", "max_tokens", "stream")
+
+
+@pytest.mark.parametrize("url_form", ["endpoint", "base"])
+def test_backends_produce_identical_results_and_payloads(stub_server, monkeypatch, url_form):
+    """Both backends send equivalent requests and return the same result."""
+    chat_url = stub_server.chat_url
+    if url_form == "base":
+        chat_url = chat_url[:-len("/chat/completions")]
+    monkeypatch.setenv("QUBRID_CHAT_URL", chat_url)
+
+    with TranslationPipeline(backend="agno") as pipeline:
+        agno_result = pipeline.translate(SAMPLE_TEXT, TARGET_LANGUAGE)
+    agno_payloads = list(stub_server.payloads)
+    stub_server.payloads.clear()
+
+    with TranslationPipeline(backend="direct") as pipeline:
+        direct_result = pipeline.translate(SAMPLE_TEXT, TARGET_LANGUAGE)
+    direct_payloads = list(stub_server.payloads)
+
+    assert agno_result["success"], agno_result.get("error")
+    assert agno_result == direct_result
+    assert direct_result["translated_text"] == STUB_REPLY
+
+    assert len(agno_payloads) == len(direct_payloads) == 2
+    for agno_payload, direct_payload in zip(agno_payloads, direct_payloads):
+        assert agno_payload["messages"] == direct_payload["messages"]
+        assert agno_payload["messages"][0]["role"] == DirectBackend.system_role
+        for key in SAMPLING_KEYS:
+            assert agno_payload.get(key) == direct_payload.get(key), key
+
+
+def test_direct_backend_leaves_sampling_to_server(stub_server):
+    """Like the Agno agents, the direct backend sends no sampling parameters."""
+    with TranslationPipeline(backend="direct") as pipeline:
+        assert pipeline.translate(SAMPLE_TEXT, TARGET_LANGUAGE)["success"]
+
+    for payload in stub_server.payloads:
+        assert not {"temperature", "top_p", "max_tokens"} & payload.keys()
+
+
+def test_direct_backend_reuses_connection(stub_server):
+    """Streamed responses are fully consumed so the session keeps one connection."""
+    with TranslationPipeline(backend="direct") as pipeline:
+        for _ in range(5):
+            assert pipeline.translate(SAMPLE_TEXT, TARGET_LANGUAGE)["success"]
+
+    assert len(stub_server.payloads) == 10
+    assert stub_server.connections == 1
+
+
+def test_direct_backend_closes_only_its_own_session(monkeypatch):
+    """close() releases the backend's session but not a caller-provided one."""
+    closed = []
+    monkeypatch.setattr(requests.Session, "close", lambda session: closed.append(session))
+
+    owned = DirectBackend()
+    with TranslationPipeline(backend=owned):
+        pass
+    assert closed == [owned.session]
+
+    shared = requests.Session()
+    DirectBackend(session=shared).close()
+    assert closed == [owned.session]
+
+
+def test_backend_selected_from_env(monkeypatch):
+    """TRANSLATION_BACKEND picks the backend when no name is given."""
+    monkeypatch.setenv("TRANSLATION_BACKEND", "direct")
+    assert isinstance(create_pipeline_backend(), DirectBackend)
+
+
+def test_unknown_backend_raises():
+    """Unknown backend names are rejected."""
+    with pytest.raises(ValueError):
+        create_pipeline_backend("missing")